@@ -467,6 +467,35 @@ void BenchKernelCRFDecoding() {
   }
 }
 
+template <typename KernelTuple, typename PlaceType>
+void BenchKernelAdamax() {
+  using T = typename KernelTuple::data_type;
+  const T beta1 = static_cast<T>(0.9);
+  const T one_sub_beta1 = 1 - beta1;
+  const T beta2 = static_cast<T>(0.999);
+  const T lr = static_cast<T>(0.01);
+  const T eps = static_cast<T>(1e-8);
+  for (int64_t numel : {1000, 100000, 1000000}) {
+    // only benchmark inplace
+    Tensor grad, mom, inf_norm, param;
+    grad.Resize({numel});
+    mom.Resize({numel});
+    inf_norm.Resize({numel});
+    param.Resize({numel});
+    T* grad_data = grad.mutable_data<T>(PlaceType());
+    T* mom_data = mom.mutable_data<T>(PlaceType());
+    T* inf_norm_data = inf_norm.mutable_data<T>(PlaceType());
+    T* param_data = param.mutable_data<T>(PlaceType());
+    RandomVec<T>(numel, grad_data, -2.f, 2.f);
+    RandomVec<T>(numel, mom_data, -2.f, 2.f);
+    RandomVec<T>(numel, inf_norm_data, 0.1f, 2.f);
+    RandomVec<T>(numel, param_data, -2.f, 2.f);
+    BenchAllImpls<KernelTuple, PlaceType>(
+        1, beta1, one_sub_beta1, beta2, lr, eps, numel, grad_data, mom_data,
+        inf_norm_data, param_data, mom_data, inf_norm_data, param_data);
+  }
+}
+
 template <typename KernelTuple, typename PlaceType>
 void BenchKernelVBroadcast() {
   using T = typename KernelTuple::data_type;
@@ -558,6 +587,7 @@ BENCH_FP32_CPU(EmbSeqPool);
 BENCH_FP32_CPU(MatMul);
 BENCH_FP32_CPU(Softmax);
 BENCH_FP32_CPU(Sgd);
+BENCH_FP32_CPU(Adamax);
 BENCH_FP32_CPU(VBroadcast);
 
 // Benchmark all jit kernels including jitcode, mkl and refer.
@@ -0,0 +1,141 @@
+/* Copyright (c) 2021 PaddlePaddle Authors. All Rights Reserved.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ * http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License. */
+
+#include "paddle/fluid/operators/jit/gen/adamax.h"
+
+#include "paddle/fluid/operators/jit/registry.h"
+#include "paddle/fluid/platform/cpu_info.h"
+
+namespace paddle {
+namespace operators {
+namespace jit {
+namespace gen {
+
+void AdamaxJitCode::loadArgs() {
+  static constexpr int32_t abs_mask = 0x7fffffff;
+
+  mov(reg_offset, abs_mask);
+  vmovq(xmm_abs_mask, reg_offset);
+  vbroadcastss(ymm_abs_mask, xmm_abs_mask);
+
+  vbroadcastss(ymm_beta1, xmm_beta1);
+  vbroadcastss(ymm_one_sub_beta1, xmm_one_sub_beta1);
+  vbroadcastss(ymm_beta2, xmm_beta2);
+  vbroadcastss(ymm_lr, xmm_lr);
+  vbroadcastss(ymm_eps, xmm_eps);
+}
+
+void AdamaxJitCode::mainCode() {
+  vmovups(ymm_grad, ptr[reg_grad_ptr + reg_offset]);
+  vmovups(ymm_mom, ptr[reg_mom_ptr + reg_offset]);
+  vmovups(ymm_inf_norm, ptr[reg_inf_norm_ptr + reg_offset]);
+
+  // mom_out = beta1 * mom + (1 - beta1) * grad
+  vmulps(ymm_mom, ymm_mom, ymm_beta1);
+  vfmadd231ps(ymm_mom, ymm_grad, ymm_one_sub_beta1);
+  vmovups(ptr[reg_mom_out_ptr + reg_offset], ymm_mom);
+
+  // inf_norm_out = max(beta2 * inf_norm + eps, |grad|)
+  vfmadd213ps(ymm_inf_norm, ymm_beta2, ymm_eps);
+  vandps(ymm_grad, ymm_grad, ymm_abs_mask);
+  vmaxps(ymm_inf_norm, ymm_inf_norm, ymm_grad);
+  vmovups(ptr[reg_inf_norm_out_ptr + reg_offset], ymm_inf_norm);
+
+  // param_out = param - lr * mom_out / inf_norm_out
+  vmovups(ymm_param, ptr[reg_param_ptr + reg_offset]);
+  vdivps(ymm_mom, ymm_mom, ymm_inf_norm);
+  vfnmadd231ps(ymm_param, ymm_mom, ymm_lr);
+  vmovups(ptr[reg_param_out_ptr + reg_offset], ymm_param);
+}
+
+void AdamaxJitCode::tailCode() {
+  vmovss(xmm_grad, ptr[reg_grad_ptr + reg_offset]);
+  vmovss(xmm_mom, ptr[reg_mom_ptr + reg_offset]);
+  vmovss(xmm_inf_norm, ptr[reg_inf_norm_ptr + reg_offset]);
+
+  vmulss(xmm_mom, xmm_mom, xmm_beta1);
+  vfmadd231ss(xmm_mom, xmm_grad, xmm_one_sub_beta1);
+  vmovss(ptr[reg_mom_out_ptr + reg_offset], xmm_mom);
+
+  vfmadd213ss(xmm_inf_norm, xmm_beta2, xmm_eps);
+  vandps(xmm_grad, xmm_grad, xmm_abs_mask);
+  vmaxss(xmm_inf_norm, xmm_inf_norm, xmm_grad);
+  vmovss(ptr[reg_inf_norm_out_ptr + reg_offset], xmm_inf_norm);
+
+  vmovss(xmm_param, ptr[reg_param_ptr + reg_offset]);
+  vdivss(xmm_mom, xmm_mom, xmm_inf_norm);
+  vfnmadd231ss(xmm_param, xmm_mom, xmm_lr);
+  vmovss(ptr[reg_param_out_ptr + reg_offset], xmm_param);
+}
+
+void AdamaxJitCode::genCode() {
+  constexpr size_t block_size = sizeof(float) * YMM_FLOAT_BLOCK;
+  // inf_norm_out and param_out are passed by stack, they should be loaded
+  // before preCode() pushes the callee-saved registers
+  mov(reg_inf_norm_out_ptr, ptr[rsp + 8]);
+  mov(reg_param_out_ptr, ptr[rsp + 16]);
+
+  preCode();
+  loadArgs();
+
+  // numel and numel_without_tail are counted in bytes
+  mov(reg_numel_without_tail, reg_numel);
+  shr(reg_numel_without_tail, 3);
+  shl(reg_numel_without_tail, 5);
+  shl(reg_numel, 2);
+  xor_(reg_offset, reg_offset);
+
+  Label main_loop, tail_loop, end;
+  cmp(reg_offset, reg_numel_without_tail);
+  jge(tail_loop, T_NEAR);
+  L(main_loop);
+  {
+    mainCode();
+    add(reg_offset, block_size);
+    cmp(reg_offset, reg_numel_without_tail);
+    jl(main_loop, T_NEAR);
+  }
+
+  L(tail_loop);
+  {
+    cmp(reg_offset, reg_numel);
+    jge(end, T_NEAR);
+    tailCode();
+    add(reg_offset, sizeof(float));
+    jmp(tail_loop, T_NEAR);
+  }
+
+  L(end);
+  postCode();
+}
+
+class AdamaxCreator : public JitCodeCreator<int> {
+ public:
+  bool CanBeUsed(const int& attr) const override {
+    return platform::MayIUse(platform::avx2);
+  }
+  size_t CodeSize(const int& attr) const override { return 512; }
+  std::unique_ptr<GenBase> CreateJitCode(const int& attr) const override {
+    return make_unique<AdamaxJitCode>(attr, CodeSize(attr));
+  }
+};
+
+}  // namespace gen
+}  // namespace jit
+}  // namespace operators
+}  // namespace paddle
+
+namespace gen = paddle::operators::jit::gen;
+
+REGISTER_JITKERNEL_GEN(kAdamax, gen::AdamaxCreator);
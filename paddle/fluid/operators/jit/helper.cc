@@ -63,6 +63,7 @@ const char* to_string(KernelType kt) {
     ONE_CASE(kSoftmax);
     ONE_CASE(kEmbSeqPool);
     ONE_CASE(kSgd);
+    ONE_CASE(kAdamax);
     default:
       PADDLE_THROW(platform::errors::Unimplemented(
           "JIT kernel do not support type: %d.", kt));
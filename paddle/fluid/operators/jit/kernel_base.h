@@ -24,8 +24,9 @@ namespace jit {
 typedef enum {
   kNone = 0,
   // sort by alphabet
-  kCRFDecoding = 1,
-  kEmbSeqPool = 2,
+  kAdamax = 1,
+  kCRFDecoding,
+  kEmbSeqPool,
   kGRUH1,
   kGRUHtPart1,
   kGRUHtPart2,
@@ -269,6 +270,18 @@ struct SgdTuple {
                             const sgd_attr_t*);
 };
 
+// beta1, 1 - beta1, beta2, lr, eps, numel, grad, mom, inf_norm, param,
+// mom_out, inf_norm_out, param_out
+// lr is the bias corrected learning rate: lr / (1 - beta1_pow)
+template <typename T>
+struct AdamaxTuple {
+  static constexpr KernelType kernel_type = kAdamax;
+  typedef T data_type;
+  typedef int attr_type;
+  typedef void (*func_type)(T, T, T, T, T, int64_t, const T*, const T*,
+                            const T*, const T*, T*, T*, T*);
+};
+
 typedef struct matmul_attr_s {
   int m, n, k;
   void* packed_weight{nullptr};
@@ -14,6 +14,7 @@
 
 #pragma once
 
+#include <algorithm>
 #include <cmath>
 #include <limits>
 #include <string>
@@ -552,6 +553,22 @@ void Sgd(const T* lr, const T* param, const T* grad, const int64_t* rows,
   }
 }
 
+// Adamax algorithm:
+// mom_out = beta1 * mom + (1 - beta1) * grad
+// inf_norm_out = max(beta2 * inf_norm + eps, |grad|)
+// param_out = param - lr * mom_out / inf_norm_out
+// here lr is the bias corrected learning rate: lr / (1 - beta1_pow)
+template <typename T>
+void Adamax(T beta1, T one_sub_beta1, T beta2, T lr, T eps, int64_t numel,
+            const T* grad, const T* mom, const T* inf_norm, const T* param,
+            T* mom_out, T* inf_norm_out, T* param_out) {
+  for (int64_t i = 0; i < numel; ++i) {
+    mom_out[i] = beta1 * mom[i] + one_sub_beta1 * grad[i];
+    inf_norm_out[i] = std::max(beta2 * inf_norm[i] + eps, std::abs(grad[i]));
+    param_out[i] = param[i] - lr * (mom_out[i] / inf_norm_out[i]);
+  }
+}
+
 #define DECLARE_REFER_KERNEL(name)                          \
   template <typename T>                                     \
   class name##Kernel : public ReferKernel<name##Tuple<T>> { \
@@ -604,6 +621,7 @@ DECLARE_REFER_KERNEL(MatMul);
 DECLARE_REFER_KERNEL(Softmax);
 DECLARE_REFER_KERNEL(EmbSeqPool);
 DECLARE_REFER_KERNEL(Sgd);
+DECLARE_REFER_KERNEL(Adamax);
 DECLARE_REFER_KERNEL(VBroadcast);
 
 #undef DECLARE_REFER_KERNEL
@@ -939,6 +939,54 @@ void TestKernelSgd() {
   }
 }
 
+template <typename KernelTuple, typename PlaceType>
+void TestKernelAdamax() {
+  using T = typename KernelTuple::data_type;
+  VLOG(10) << "Test JITKernel: " << jit::to_string(KernelTuple::kernel_type);
+  const T beta1 = static_cast<T>(0.9);
+  const T one_sub_beta1 = 1 - beta1;
+  const T beta2 = static_cast<T>(0.999);
+  const T lr = static_cast<T>(0.01);
+  const T eps = static_cast<T>(1e-8);
+  for (int numel : TestSizes()) {
+    std::vector<T> grad(numel), mom(numel), inf_norm(numel), param(numel);
+    RandomVec<T>(numel, grad.data());
+    RandomVec<T>(numel, mom.data());
+    RandomVec<T>(numel, inf_norm.data(), static_cast<T>(0.1f));
+    RandomVec<T>(numel, param.data());
+
+    auto ref = jit::GetReferFunc<KernelTuple>();
+    EXPECT_TRUE(ref != nullptr);
+    std::vector<T> mom_ref(numel), inf_norm_ref(numel), param_ref(numel);
+    ref(beta1, one_sub_beta1, beta2, lr, eps, numel, grad.data(), mom.data(),
+        inf_norm.data(), param.data(), mom_ref.data(), inf_norm_ref.data(),
+        param_ref.data());
+
+    auto verifier = [](
+        const typename KernelTuple::func_type tgt, const T beta1,
+        const T one_sub_beta1, const T beta2, const T lr, const T eps,
+        const std::vector<T>& grad, const std::vector<T>& mom,
+        const std::vector<T>& inf_norm, const std::vector<T>& param,
+        const std::vector<T>& mom_ref, const std::vector<T>& inf_norm_ref,
+        const std::vector<T>& param_ref) {
+      EXPECT_TRUE(tgt != nullptr);
+      const int64_t numel = param.size();
+      // inplace, as the adamax op does
+      std::vector<T> mom_out(mom), inf_norm_out(inf_norm), param_out(param);
+      tgt(beta1, one_sub_beta1, beta2, lr, eps, numel, grad.data(),
+          mom_out.data(), inf_norm_out.data(), param_out.data(),
+          mom_out.data(), inf_norm_out.data(), param_out.data());
+      ExpectEQ<T>(mom_out.data(), mom_ref.data(), numel);
+      ExpectEQ<T>(inf_norm_out.data(), inf_norm_ref.data(), numel);
+      ExpectEQ<T>(param_out.data(), param_ref.data(), numel);
+    };
+    TestAllImpls<KernelTuple, PlaceType>(1, verifier, beta1, one_sub_beta1,
+                                         beta2, lr, eps, grad, mom, inf_norm,
+                                         param, mom_ref, inf_norm_ref,
+                                         param_ref);
+  }
+}
+
 template <typename KernelTuple, typename PlaceType>
 void TestKernelVBroadcast() {
   using T = typename KernelTuple::data_type;
@@ -1384,6 +1432,7 @@ TEST_CPU_KERNEL(EmbSeqPool);
 TEST_CPU_KERNEL(MatMul);
 TEST_CPU_KERNEL(Softmax);
 TEST_CPU_KERNEL(Sgd);
+TEST_CPU_KERNEL(Adamax);
 TEST_CPU_KERNEL(VBroadcast);
 
 TEST_CPU_KERNEL(StrideASum);
@@ -13,6 +13,7 @@ See the License for the specific language governing permissions and
 limitations under the License. */
 
 #include "paddle/fluid/operators/optimizers/adamax_op.h"
+#include "paddle/fluid/framework/op_version_registry.h"
 
 namespace paddle {
 namespace operators {
@@ -82,6 +83,9 @@ class AdamaxOp : public framework::OperatorWithKernel {
     ctx->SetOutputDim("ParamOut", param_dims);
     ctx->SetOutputDim("MomentOut", param_dims);
     ctx->SetOutputDim("InfNormOut", param_dims);
+    if (ctx->HasOutput("Beta1PowOut")) {
+      ctx->SetOutputDim("Beta1PowOut", beta1_pow_dims);
+    }
   }
   framework::OpKernelType GetExpectedKernelType(
       const framework::ExecutionContext &ctx) const override {
@@ -107,12 +111,21 @@ class AdamaxOpMaker : public framework::OpProtoAndCheckerMaker {
     AddOutput("InfNormOut",
               "(Tensor) "
               "Output exponentially weighted infinity norm");
+    AddOutput("Beta1PowOut",
+              "(Tensor) Output beta1 power accumulator, it is updated "
+              "by the optimizer when not given")
+        .AsDispensable();
 
     AddAttr<float>("beta1",
                    "(float, default 0.9) "
                    "Exponential decay rate for the "
                    "1st moment estimates.")
         .SetDefault(0.9f);
+    AddAttr<float>("one_minus_beta1",
+                   "(float, default -1.0) "
+                   "1 - beta1, precomputed by the optimizer. "
+                   "It is computed from beta1 when negative.")
+        .SetDefault(-1.0f);
     AddAttr<float>("beta2",
                    "(float, default 0.999) "
                    "exponential decay rate for the weighted "
@@ -154,3 +167,22 @@ REGISTER_OP_WITHOUT_GRADIENT(adamax, ops::AdamaxOp, ops::AdamaxOpMaker);
 REGISTER_OP_CPU_KERNEL(
     adamax, ops::AdamaxOpKernel<paddle::platform::CPUDeviceContext, float>,
     ops::AdamaxOpKernel<paddle::platform::CPUDeviceContext, double>);
+
+REGISTER_OP_VERSION(adamax)
+    .AddCheckpoint(
+        R"ROC(
+      Upgrade adamax add 1 attribute [one_minus_beta1].
+    )ROC",
+        paddle::framework::compatible::OpVersionDesc().NewAttr(
+            "one_minus_beta1",
+            "(float) 1 - beta1 precomputed by the optimizer, it is computed "
+            "from beta1 when negative.",
+            -1.0f))
+    .AddCheckpoint(
+        R"ROC(
+      Upgrade adamax, add 1 dispensable output [Beta1PowOut].
+    )ROC",
+        paddle::framework::compatible::OpVersionDesc().NewOutput(
+            "Beta1PowOut",
+            "The updated beta1 power accumulator, if given, the adamax "
+            "op updates it instead of a separate scale op."));
@@ -15,10 +15,141 @@ limitations under the License. */
 #pragma once
 #include "paddle/fluid/framework/eigen.h"
 #include "paddle/fluid/framework/op_registry.h"
+#include "paddle/fluid/operators/jit/kernels.h"
 
 namespace paddle {
 namespace operators {
 
+#if defined(__NVCC__) || defined(__HIPCC__)
+template <typename T>
+__global__ void AdamaxCUDAKernel(T beta1, T one_minus_beta1, T beta2,
+                                 T epsilon, const T* lr_, const T* beta1_pow_,
+                                 const T* grad, const T* moment,
+                                 const T* inf_norm, const T* param,
+                                 T* moment_out, T* inf_norm_out, T* param_out,
+                                 int64_t numel) {
+  T lr = *lr_ / (static_cast<T>(1.0) - *beta1_pow_);
+
+  int64_t id = static_cast<int64_t>(blockIdx.x) * blockDim.x + threadIdx.x;
+  int64_t stride = static_cast<int64_t>(gridDim.x) * blockDim.x;
+  for (; id < numel; id += stride) {
+    T g = grad[id];
+    T mom = beta1 * moment[id] + one_minus_beta1 * g;
+    T norm = fmax(beta2 * inf_norm[id] + epsilon, fabs(g));
+    moment_out[id] = mom;
+    inf_norm_out[id] = norm;
+    param_out[id] = param[id] - lr * (mom / norm);
+  }
+}
+#endif
+
+// attr(one_minus_beta1) is precomputed by the python optimizer, it keeps the
+// negative default in programs which do not set it
+template <typename T>
+inline T GetOneMinusBeta1(const framework::ExecutionContext& ctx, T beta1) {
+  float one_minus_beta1 = ctx.Attr<float>("one_minus_beta1");
+  if (one_minus_beta1 < 0.0f) {
+    return static_cast<T>(1.0) - beta1;
+  }
+  return static_cast<T>(one_minus_beta1);
+}
+
+template <typename DeviceContext, typename T>
+void AdamaxUpdate(const DeviceContext& dev_ctx, T beta1, T one_minus_beta1,
+                  T beta2, T epsilon,
+                  const framework::Tensor& param_tensor,
+                  const framework::Tensor& grad_tensor,
+                  const framework::Tensor& lr_tensor,
+                  const framework::Tensor& moment_tensor,
+                  const framework::Tensor& inf_norm_tensor,
+                  const framework::Tensor& beta1_pow_tensor,
+                  framework::Tensor* param_out_tensor,
+                  framework::Tensor* moment_out_tensor,
+                  framework::Tensor* inf_norm_out_tensor,
+                  framework::Tensor* beta1_pow_out_tensor = nullptr) {
+  param_out_tensor->mutable_data<T>(dev_ctx.GetPlace());
+  moment_out_tensor->mutable_data<T>(dev_ctx.GetPlace());
+  inf_norm_out_tensor->mutable_data<T>(dev_ctx.GetPlace());
+  if (beta1_pow_out_tensor != nullptr) {
+    beta1_pow_out_tensor->mutable_data<T>(dev_ctx.GetPlace());
+  }
+
+  if (platform::is_cpu_place(dev_ctx.GetPlace())) {
+    const T* beta1_pow = beta1_pow_tensor.data<T>();
+    const T lr_t = lr_tensor.data<T>()[0] / (1 - beta1_pow[0]);
+
+    // the attr is not used, jitcode handles any numel at runtime
+    auto adamax =
+        jit::KernelFuncs<jit::AdamaxTuple<T>, platform::CPUPlace>::Cache().At(
+            1);
+    adamax(beta1, one_minus_beta1, beta2, lr_t, epsilon,
+           param_out_tensor->numel(), grad_tensor.data<T>(),
+           moment_tensor.data<T>(), inf_norm_tensor.data<T>(),
+           param_tensor.data<T>(), moment_out_tensor->data<T>(),
+           inf_norm_out_tensor->data<T>(), param_out_tensor->data<T>());
+    if (beta1_pow_out_tensor != nullptr) {
+      beta1_pow_out_tensor->data<T>()[0] = beta1_pow[0] * beta1;
+    }
+    return;
+  }
+
+  if (platform::is_gpu_place(dev_ctx.GetPlace())) {
+#if defined(__NVCC__) || defined(__HIPCC__)
+    // update moment, inf_norm and param with one kernel, which reads and
+    // writes every element only once
+    int64_t numel = param_out_tensor->numel();
+    // no kernel is launched for an empty parameter, 0 blocks is invalid
+    if (numel > 0) {
+      int threads = 512;
+      int64_t blocks = (numel + threads - 1) / threads;
+      // the kernel strides over the grid, so the blocks can be capped
+      int64_t max_blocks = dev_ctx.GetCUDAMaxGridDimSize().x;
+      blocks = blocks < max_blocks ? blocks : max_blocks;
+      AdamaxCUDAKernel<T><<<blocks, threads, 0, dev_ctx.stream()>>>(
+          beta1, one_minus_beta1, beta2, epsilon, lr_tensor.data<T>(),
+          beta1_pow_tensor.data<T>(), grad_tensor.data<T>(),
+          moment_tensor.data<T>(), inf_norm_tensor.data<T>(),
+          param_tensor.data<T>(), moment_out_tensor->data<T>(),
+          inf_norm_out_tensor->data<T>(), param_out_tensor->data<T>(),
+          numel);
+    }
+    if (beta1_pow_out_tensor != nullptr) {
+      // launched after the update kernel, which reads beta1_pow
+      auto beta1_pow = framework::EigenVector<T>::Flatten(beta1_pow_tensor);
+      auto beta1_pow_out =
+          framework::EigenVector<T>::Flatten(*beta1_pow_out_tensor);
+      beta1_pow_out.device(*dev_ctx.eigen_device()) = beta1_pow * beta1;
+    }
+    return;
+#endif
+  }
+
+  auto param = framework::EigenVector<T>::Flatten(param_tensor);
+  auto grad = framework::EigenVector<T>::Flatten(grad_tensor);
+  auto moment = framework::EigenVector<T>::Flatten(moment_tensor);
+  auto inf_norm = framework::EigenVector<T>::Flatten(inf_norm_tensor);
+  auto lr = framework::EigenVector<T>::Flatten(lr_tensor);
+  auto beta1_pow = framework::EigenVector<T>::Flatten(beta1_pow_tensor);
+  auto param_out = framework::EigenVector<T>::Flatten(*param_out_tensor);
+  auto moment_out = framework::EigenVector<T>::Flatten(*moment_out_tensor);
+  auto inf_norm_out =
+      framework::EigenVector<T>::Flatten(*inf_norm_out_tensor);
+  auto* place = dev_ctx.eigen_device();
+
+  moment_out.device(*place) = beta1 * moment + one_minus_beta1 * grad;
+  inf_norm_out.device(*place) =
+      grad.abs().cwiseMax((beta2 * inf_norm) + epsilon);
+  auto lr_t = lr / (1 - beta1_pow);
+  Eigen::DSizes<int, 1> m_dsize(moment_out_tensor->numel());
+  param_out.device(*place) =
+      param - lr_t.broadcast(m_dsize) * (moment_out / inf_norm_out);
+  if (beta1_pow_out_tensor != nullptr) {
+    auto beta1_pow_out =
+        framework::EigenVector<T>::Flatten(*beta1_pow_out_tensor);
+    beta1_pow_out.device(*place) = beta1_pow * beta1;
+  }
+}
+
 template <typename DeviceContext, typename T>
 class AdamaxOpKernel : public framework::OpKernel<T> {
  public:
@@ -38,43 +169,24 @@ class AdamaxOpKernel : public framework::OpKernel<T> {
                           ctx.InputNames("Grad").front(),
                           framework::ToTypeName(grad_var->Type())));
 
-    auto param_out_tensor = ctx.Output<framework::Tensor>("ParamOut");
-    auto moment_out_tensor = ctx.Output<framework::Tensor>("MomentOut");
-    auto inf_norm_out_tensor = ctx.Output<framework::Tensor>("InfNormOut");
-
-    param_out_tensor->mutable_data<T>(ctx.GetPlace());
-    moment_out_tensor->mutable_data<T>(ctx.GetPlace());
-    inf_norm_out_tensor->mutable_data<T>(ctx.GetPlace());
-
     T beta1 = static_cast<T>(ctx.Attr<float>("beta1"));
+    T one_minus_beta1 = GetOneMinusBeta1<T>(ctx, beta1);
     T beta2 = static_cast<T>(ctx.Attr<float>("beta2"));
     T epsilon = static_cast<T>(ctx.Attr<float>("epsilon"));
 
-    auto param = framework::EigenVector<T>::Flatten(
-        *ctx.Input<framework::Tensor>("Param"));
-    auto grad = framework::EigenVector<T>::Flatten(
-        *ctx.Input<framework::Tensor>("Grad"));
-    auto moment = framework::EigenVector<T>::Flatten(
-        *ctx.Input<framework::Tensor>("Moment"));
-    auto inf_norm = framework::EigenVector<T>::Flatten(
-        *ctx.Input<framework::Tensor>("InfNorm"));
-    auto lr = framework::EigenVector<T>::Flatten(
-        *ctx.Input<framework::Tensor>("LearningRate"));
-    auto beta1_pow = framework::EigenVector<T>::Flatten(
-        *ctx.Input<framework::Tensor>("Beta1Pow"));
-    auto param_out = framework::EigenVector<T>::Flatten(*param_out_tensor);
-    auto moment_out = framework::EigenVector<T>::Flatten(*moment_out_tensor);
-    auto inf_norm_out =
-        framework::EigenVector<T>::Flatten(*inf_norm_out_tensor);
-    auto* place = ctx.template device_context<DeviceContext>().eigen_device();
-
-    moment_out.device(*place) = beta1 * moment + (1 - beta1) * grad;
-    inf_norm_out.device(*place) =
-        grad.abs().cwiseMax((beta2 * inf_norm) + epsilon);
-    auto lr_t = lr / (1 - beta1_pow);
-    Eigen::DSizes<int, 1> m_dsize(moment_out_tensor->numel());
-    param_out.device(*place) =
-        param - lr_t.broadcast(m_dsize) * (moment_out / inf_norm_out);
+    AdamaxUpdate<DeviceContext, T>(
+        ctx.template device_context<DeviceContext>(), beta1, one_minus_beta1,
+        beta2, epsilon,
+        *ctx.Input<framework::Tensor>("Param"),
+        *ctx.Input<framework::Tensor>("Grad"),
+        *ctx.Input<framework::Tensor>("LearningRate"),
+        *ctx.Input<framework::Tensor>("Moment"),
+        *ctx.Input<framework::Tensor>("InfNorm"),
+        *ctx.Input<framework::Tensor>("Beta1Pow"),
+        ctx.Output<framework::Tensor>("ParamOut"),
+        ctx.Output<framework::Tensor>("MomentOut"),
+        ctx.Output<framework::Tensor>("InfNormOut"),
+        ctx.Output<framework::Tensor>("Beta1PowOut"));
   }
 };
 
@@ -0,0 +1,188 @@
+/* Copyright (c) 2021 PaddlePaddle Authors. All Rights Reserved.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License. */
+
+#include "paddle/fluid/operators/optimizers/multi_tensor_adamax_op.h"
+
+#include <string>
+#include <vector>
+
+namespace paddle {
+namespace operators {
+
+class MultiTensorAdamaxOp : public framework::OperatorWithKernel {
+ public:
+  using framework::OperatorWithKernel::OperatorWithKernel;
+
+  void InferShape(framework::InferShapeContext *ctx) const override {
+    OP_INOUT_CHECK(ctx->HasInputs("Param"), "Input", "Param",
+                   "MultiTensorAdamax");
+    OP_INOUT_CHECK(ctx->HasInputs("Grad"), "Input", "Grad",
+                   "MultiTensorAdamax");
+    OP_INOUT_CHECK(ctx->HasInputs("LearningRate"), "Input", "LearningRate",
+                   "MultiTensorAdamax");
+    OP_INOUT_CHECK(ctx->HasInputs("Moment"), "Input", "Moment",
+                   "MultiTensorAdamax");
+    OP_INOUT_CHECK(ctx->HasInputs("InfNorm"), "Input", "InfNorm",
+                   "MultiTensorAdamax");
+    OP_INOUT_CHECK(ctx->HasInputs("Beta1Pow"), "Input", "Beta1Pow",
+                   "MultiTensorAdamax");
+    OP_INOUT_CHECK(ctx->HasOutputs("ParamOut"), "Output", "ParamOut",
+                   "MultiTensorAdamax");
+    OP_INOUT_CHECK(ctx->HasOutputs("MomentOut"), "Output", "MomentOut",
+                   "MultiTensorAdamax");
+    OP_INOUT_CHECK(ctx->HasOutputs("InfNormOut"), "Output", "InfNormOut",
+                   "MultiTensorAdamax");
+
+    const size_t n = ctx->Inputs("Param").size();
+    for (auto &name : {"Grad", "LearningRate", "Moment", "InfNorm",
+                       "Beta1Pow"}) {
+      PADDLE_ENFORCE_EQ(
+          ctx->Inputs(name).size(), n,
+          platform::errors::InvalidArgument(
+              "The size of Input(%s) of MultiTensorAdamaxOp should be equal "
+              "to the size of Input(Param) %d, but the received is %d.",
+              name, n, ctx->Inputs(name).size()));
+    }
+    std::vector<std::string> output_names = {"ParamOut", "MomentOut",
+                                             "InfNormOut"};
+    if (ctx->HasOutputs("Beta1PowOut")) {
+      output_names.emplace_back("Beta1PowOut");
+    }
+    for (auto &name : output_names) {
+      PADDLE_ENFORCE_EQ(
+          ctx->Outputs(name).size(), n,
+          platform::errors::InvalidArgument(
+              "The size of Output(%s) of MultiTensorAdamaxOp should be equal "
+              "to the size of Input(Param) %d, but the received is %d.",
+              name, n, ctx->Outputs(name).size()));
+    }
+
+    auto param_dims = ctx->GetInputsDim("Param");
+    auto grad_dims = ctx->GetInputsDim("Grad");
+    auto moment_dims = ctx->GetInputsDim("Moment");
+    auto inf_norm_dims = ctx->GetInputsDim("InfNorm");
+    auto lr_dims = ctx->GetInputsDim("LearningRate");
+    auto beta1_pow_dims = ctx->GetInputsDim("Beta1Pow");
+    for (size_t i = 0; i < n; ++i) {
+      PADDLE_ENFORCE_EQ(framework::product(lr_dims[i]), 1,
+                        platform::errors::InvalidArgument(
+                            "Learning rate should have 1 dimension"));
+      PADDLE_ENFORCE_EQ(
+          framework::product(beta1_pow_dims[i]), 1,
+          platform::errors::InvalidArgument(
+              "Beta1 power accumulator should have 1 dimension"));
+      PADDLE_ENFORCE_EQ(param_dims[i], grad_dims[i],
+                        platform::errors::InvalidArgument(
+                            "Param and Grad input of MultiTensorAdamaxOp "
+                            "should have same dimension"));
+      PADDLE_ENFORCE_EQ(param_dims[i], moment_dims[i],
+                        platform::errors::InvalidArgument(
+                            "Param and Moment input of MultiTensorAdamaxOp "
+                            "should have same dimension"));
+      PADDLE_ENFORCE_EQ(param_dims[i], inf_norm_dims[i],
+                        platform::errors::InvalidArgument(
+                            "Param and InfNorm input of MultiTensorAdamaxOp "
+                            "should have same dimension"));
+    }
+
+    ctx->SetOutputsDim("ParamOut", param_dims);
+    ctx->SetOutputsDim("MomentOut", param_dims);
+    ctx->SetOutputsDim("InfNormOut", param_dims);
+    if (ctx->HasOutputs("Beta1PowOut")) {
+      ctx->SetOutputsDim("Beta1PowOut", beta1_pow_dims);
+    }
+  }
+  framework::OpKernelType GetExpectedKernelType(
+      const framework::ExecutionContext &ctx) const override {
+    return framework::OpKernelType(
+        OperatorWithKernel::IndicateVarDataType(ctx, "Param"), ctx.GetPlace());
+  }
+};
+
+class MultiTensorAdamaxOpMaker : public framework::OpProtoAndCheckerMaker {
+ public:
+  void Make() override {
+    AddInput("Param", "(Tensors) Input parameters").AsDuplicable();
+    AddInput("Grad", "(Tensors) Input gradients").AsDuplicable();
+    AddInput("LearningRate", "(Tensors) Learning rates").AsDuplicable();
+    AddInput("Moment", "(Tensors) First moments").AsDuplicable();
+    AddInput("InfNorm",
+             "(Tensors) "
+             "Input exponentially weighted infinity norms")
+        .AsDuplicable();
+    AddInput("Beta1Pow", "(Tensors) Input beta1 power accumulators")
+        .AsDuplicable();
+
+    AddOutput("ParamOut", "(Tensors) Output parameters").AsDuplicable();
+    AddOutput("MomentOut", "(Tensors) Output first moments").AsDuplicable();
+    AddOutput("InfNormOut",
+              "(Tensors) "
+              "Output exponentially weighted infinity norms")
+        .AsDuplicable();
+    AddOutput("Beta1PowOut",
+              "(Tensors) Output beta1 power accumulators, they are updated "
+              "by the optimizer when not given, e.g. when all the parameters "
+              "share one accumulator")
+        .AsDuplicable()
+        .AsDispensable();
+
+    AddAttr<float>("beta1",
+                   "(float, default 0.9) "
+                   "Exponential decay rate for the "
+                   "1st moment estimates.")
+        .SetDefault(0.9f);
+    AddAttr<float>("one_minus_beta1",
+                   "(float, default -1.0) "
+                   "1 - beta1, precomputed by the optimizer. "
+                   "It is computed from beta1 when negative.")
+        .SetDefault(-1.0f);
+    AddAttr<float>("beta2",
+                   "(float, default 0.999) "
+                   "exponential decay rate for the weighted "
+                   "infinity norm estimates.")
+        .SetDefault(0.999f);
+    AddAttr<float>("epsilon",
+                   "(float, default 1.0e-8) "
+                   "Constant for numerical stability")
+        .SetDefault(1.0e-8f);
+    AddComment(R"DOC(
+MultiTensorAdamax Optimizer.
+
+Applies the Adamax update of adamax operator to a list of parameters
+in one operator, the i-th parameter is updated by the i-th tensor of
+each input:
+
+$$
+moment\_out = \beta_1 * moment + (1 - \beta_1) * grad \\
+inf\_norm\_out = max(\beta_2 * inf\_norm + \epsilon, |grad|) \\
+learning\_rate = \frac{learning\_rate}{1 - \beta_{1\_pow}} \\
+param\_out = param - learning\_rate * \frac{moment\_out}{inf\_norm\_out} \\
+\beta_{1\_pow\_out} = \beta_{1\_pow} * \beta_1
+$$
+
+)DOC");
+  }
+};
+
+}  // namespace operators
+}  // namespace paddle
+
+namespace ops = paddle::operators;
+REGISTER_OP_WITHOUT_GRADIENT(multi_tensor_adamax, ops::MultiTensorAdamaxOp,
+                             ops::MultiTensorAdamaxOpMaker);
+REGISTER_OP_CPU_KERNEL(
+    multi_tensor_adamax,
+    ops::MultiTensorAdamaxOpKernel<paddle::platform::CPUDeviceContext, float>,
+    ops::MultiTensorAdamaxOpKernel<paddle::platform::CPUDeviceContext,
+                                   double>);
@@ -0,0 +1,98 @@
+/* Copyright (c) 2021 PaddlePaddle Authors. All Rights Reserved.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License. */
+
+#pragma once
+#include <vector>
+#include "paddle/fluid/framework/op_registry.h"
+#include "paddle/fluid/operators/optimizers/adamax_op.h"
+
+namespace paddle {
+namespace operators {
+
+template <typename DeviceContext, typename T>
+class MultiTensorAdamaxOpKernel : public framework::OpKernel<T> {
+ public:
+  void Compute(const framework::ExecutionContext& ctx) const override {
+    const auto params = ctx.MultiInput<framework::Tensor>("Param");
+    const auto grads = ctx.MultiInput<framework::Tensor>("Grad");
+    const auto lrs = ctx.MultiInput<framework::Tensor>("LearningRate");
+    const auto moments = ctx.MultiInput<framework::Tensor>("Moment");
+    const auto inf_norms = ctx.MultiInput<framework::Tensor>("InfNorm");
+    const auto beta1_pows = ctx.MultiInput<framework::Tensor>("Beta1Pow");
+    auto param_outs = ctx.MultiOutput<framework::Tensor>("ParamOut");
+    auto moment_outs = ctx.MultiOutput<framework::Tensor>("MomentOut");
+    auto inf_norm_outs = ctx.MultiOutput<framework::Tensor>("InfNormOut");
+    auto beta1_pow_outs = ctx.MultiOutput<framework::Tensor>("Beta1PowOut");
+
+    T beta1 = static_cast<T>(ctx.Attr<float>("beta1"));
+    T one_minus_beta1 = GetOneMinusBeta1<T>(ctx, beta1);
+    T beta2 = static_cast<T>(ctx.Attr<float>("beta2"));
+    T epsilon = static_cast<T>(ctx.Attr<float>("epsilon"));
+
+    const auto& dev_ctx = ctx.template device_context<DeviceContext>();
+    const size_t n = params.size();
+    if (!platform::is_cpu_place(ctx.GetPlace())) {
+      for (size_t i = 0; i < n; ++i) {
+        AdamaxUpdate<DeviceContext, T>(
+            dev_ctx, beta1, one_minus_beta1, beta2, epsilon, *params[i],
+            *grads[i], *lrs[i], *moments[i], *inf_norms[i], *beta1_pows[i],
+            param_outs[i], moment_outs[i], inf_norm_outs[i],
+            beta1_pow_outs.empty() ? nullptr : beta1_pow_outs[i]);
+      }
+      return;
+    }
+
+    // an exception must not escape the omp region, so the outputs are
+    // allocated and the pointers are fetched here, the parallel loop only
+    // calls the jit kernel
+    std::vector<T> lr_ts(n);
+    std::vector<int64_t> numels(n);
+    std::vector<const T*> grad_ptrs(n), moment_ptrs(n), inf_norm_ptrs(n),
+        param_ptrs(n);
+    std::vector<T*> moment_out_ptrs(n), inf_norm_out_ptrs(n),
+        param_out_ptrs(n);
+    for (size_t i = 0; i < n; ++i) {
+      const T beta1_pow = beta1_pows[i]->data<T>()[0];
+      lr_ts[i] = lrs[i]->data<T>()[0] / (1 - beta1_pow);
+      numels[i] = params[i]->numel();
+      grad_ptrs[i] = grads[i]->data<T>();
+      moment_ptrs[i] = moments[i]->data<T>();
+      inf_norm_ptrs[i] = inf_norms[i]->data<T>();
+      param_ptrs[i] = params[i]->data<T>();
+      moment_out_ptrs[i] = moment_outs[i]->mutable_data<T>(ctx.GetPlace());
+      inf_norm_out_ptrs[i] =
+          inf_norm_outs[i]->mutable_data<T>(ctx.GetPlace());
+      param_out_ptrs[i] = param_outs[i]->mutable_data<T>(ctx.GetPlace());
+      if (!beta1_pow_outs.empty()) {
+        beta1_pow_outs[i]->mutable_data<T>(ctx.GetPlace())[0] =
+            beta1_pow * beta1;
+      }
+    }
+
+    auto adamax =
+        jit::KernelFuncs<jit::AdamaxTuple<T>, platform::CPUPlace>::Cache().At(
+            1);
+#ifdef PADDLE_WITH_MKLML
+#pragma omp parallel for
+#endif
+    for (int64_t i = 0; i < static_cast<int64_t>(n); ++i) {
+      adamax(beta1, one_minus_beta1, beta2, lr_ts[i], epsilon, numels[i],
+             grad_ptrs[i], moment_ptrs[i], inf_norm_ptrs[i], param_ptrs[i],
+             moment_out_ptrs[i], inf_norm_out_ptrs[i], param_out_ptrs[i]);
+    }
+  }
+};
+
+}  // namespace operators
+}  // namespace paddle
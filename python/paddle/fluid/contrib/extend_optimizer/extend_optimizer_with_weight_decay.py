@@ -13,6 +13,7 @@
 # limitations under the License.
 import paddle.fluid
 from paddle.fluid import framework as framework
+from paddle.fluid.layer_helper import LayerHelper
 
 __all__ = ["extend_with_decoupled_weight_decay"]
 
@@ -24,51 +25,116 @@ class DecoupledWeightDecay(object):
             raise TypeError("coeff should be float or Variable.")
         self._params_name = set()
         self._apply_decay_param_fun = apply_decay_param_fun
+        # results of apply_decay_param_fun, keyed by parameter name
+        self._decay_param_cache = {}
         self._coeff = coeff
+        self._is_float_coeff = isinstance(coeff, float)
+        self._coeff_is_zero = self._is_float_coeff and coeff == 0.0
         super(DecoupledWeightDecay, self).__init__(**kwargs)
 
+    def _should_decay(self, name):
+        if self._apply_decay_param_fun is None:
+            return True
+        should_decay = self._decay_param_cache.get(name)
+        if should_decay is None:
+            should_decay = self._apply_decay_param_fun(name)
+            self._decay_param_cache[name] = should_decay
+        return should_decay
+
     def _scale_parameters(self, params_and_grads):
         """
         Adds weight decay ops.
-            scaled_parameter = parameter * coeff
+            parameter = parameter * (1 - coeff)
+
+        Every decayed parameter is scaled in place by its own op, so the op
+        only carries that parameter and its gradient in op_role_var.
 
         Args:
             params_and_grads: A list of (parameters, gradients) pairs,
                 the parameters need to decay.
+        Returns:
+            list: The (parameters, gradients) pairs which are decayed.
         Raises:
             Exception: The type of coeff and parameter is not consistent.
         """
-        if isinstance(self._coeff, float) and self._coeff == 0.0:
-            return
+        if __debug__:
+            names = [param.name for param, _ in params_and_grads]
+            assert len(set(names)) == len(names), \
+                "parameters to decay should be unique, but got %s" % names
+
+        decay_params_grads = []
+        if self._coeff_is_zero:
+            self._params_name = set()
+            return decay_params_grads
 
-        scaled_params = []
         for param, grad in params_and_grads:
             # If no gradient then we don't need to do anything
             if grad is None:
                 continue
-            if self._apply_decay_param_fun is not None \
-                    and not self._apply_decay_param_fun(param.name):
+            if not self._should_decay(param.name):
                 continue
 
-            if isinstance(self._coeff, float):
+            if self._is_float_coeff:
                 assert param.dtype is not paddle.fluid.core.VarDesc.VarType.FP32, \
                     "the type of coeff(float) and parameter(%s) is not consistent."%(self._coeff.dtype)
             else:
                 assert self._coeff.dtype == param.dtype, \
                     "the type of coeff(%s) and parameter(%s) is not consistent."%(self._coeff.dtype, param.dtype)
 
+            decay_params_grads.append((param, grad))
+
+        # names of the parameters decayed by the last call, for __str__
+        self._params_name = set(param.name for param, _ in decay_params_grads)
+        if not decay_params_grads:
+            return decay_params_grads
+
+        helper = LayerHelper('weight_decay')
+        one_minus_coeff = None
+        if not self._is_float_coeff:
+            # computed once and shared by the op of every parameter
+            program = decay_params_grads[0][0].block.program
+            with program._lr_schedule_guard():
+                one_minus_coeff = helper.create_variable_for_type_inference(
+                    dtype=self._coeff.dtype)
+                helper.append_op(
+                    type='scale',
+                    inputs={'X': self._coeff},
+                    outputs={'Out': one_minus_coeff},
+                    attrs={'scale': -1.0,
+                           'bias': 1.0})
+
+        for param, grad in decay_params_grads:
             with param.block.program._optimized_guard(
                 [param, grad]), framework.name_scope('weight decay'):
-                assert param.name not in self._params_name
-                scaled_params.append((param, grad, param * self._coeff))
-                self._params_name.add(param.name)
-        return scaled_params
+                if self._is_float_coeff:
+                    helper.append_op(
+                        type='scale',
+                        inputs={'X': param},
+                        outputs={'Out': param},
+                        attrs={'scale': 1.0 - self._coeff})
+                else:
+                    # multiply on the device, a ScaleTensor would be copied
+                    # back to the host for every parameter
+                    helper.append_op(
+                        type='elementwise_mul',
+                        inputs={'X': param,
+                                'Y': one_minus_coeff},
+                        outputs={'Out': param},
+                        attrs={'axis': -1})
+
+        return decay_params_grads
 
     def backward(self, **kargs):
         return super(DecoupledWeightDecay, self).backward(**kargs)
 
-    def apply_optimize(self, **kargs):
-        return super(DecoupledWeightDecay, self).apply_optimize(**kargs)
+    def apply_optimize(self, loss, startup_program, params_grads):
+        # minimize and the backward + apply_optimize calls both get here,
+        # the parameters are decayed before they are optimized
+        self._scale_parameters(params_grads)
+        return super(DecoupledWeightDecay, self).apply_optimize(
+            loss=loss,
+            startup_program=startup_program,
+            params_grads=params_grads)
 
     def minimize(self,
                  loss,
@@ -80,15 +146,6 @@ class DecoupledWeightDecay(object):
             startup_program=startup_program,
             parameter_list=parameter_list,
             no_grad_set=no_grad_set)
-        scaled_params = self._scale_parameters(params_grads)
-        for p_grad_sgrad in scaled_params:
-            param, grad, scaled_param = p_grad_sgrad
-            with param.block.program._optimized_guard(
-                [param, grad]), framework.name_scope('weight decay'):
-                updated_param = paddle.fluid.layers.elementwise_sub(
-                    x=param, y=scaled_param)
-                paddle.fluid.layers.assign(input=updated_param, output=param)
-
         optimize_ops = self.apply_optimize(
             loss=loss,
             params_grads=params_grads,
@@ -87,6 +87,17 @@ def bow_net(data,
     return avg_cost
 
 
+def weight_decay_ops(program):
+    # the weight decay scales every parameter in place
+    block = program.global_block()
+    param_names = set(param.name for param in block.all_parameters())
+    return [
+        op for op in block.ops
+        if op.type == 'scale' and op.input('X')[0] in param_names and
+        op.output('Out') == op.input('X')
+    ]
+
+
 class TestWeightDecay(unittest.TestCase):
     def setUp(self):
         # set seed
@@ -120,7 +131,7 @@ class TestWeightDecay(unittest.TestCase):
             param_sum.append(p_sum)
         return param_sum
 
-    def check_weight_decay(self, place, model):
+    def check_weight_decay(self, place, model, tensor_coeff=False):
         main_prog = fluid.framework.Program()
         startup_prog = fluid.framework.Program()
 
@@ -132,9 +143,12 @@ class TestWeightDecay(unittest.TestCase):
             AdamW = fluid.contrib.extend_with_decoupled_weight_decay(
                 fluid.optimizer.Adam)
 
+            weight_decay = self.learning_rate
+            if tensor_coeff:
+                weight_decay = fluid.layers.fill_constant(
+                    shape=[1], dtype='float32', value=self.learning_rate)
             optimizer = AdamW(
-                learning_rate=self.learning_rate,
-                weight_decay=self.learning_rate)
+                learning_rate=self.learning_rate, weight_decay=weight_decay)
 
             optimizer.minimize(avg_cost)
             param_sum = self.run_program(place, [data, label])
@@ -169,6 +183,112 @@ class TestWeightDecay(unittest.TestCase):
             param_sum = self.run_program(place, [data, label])
         return param_sum
 
+    def test_zero_weight_decay(self):
+        main_prog = fluid.framework.Program()
+        startup_prog = fluid.framework.Program()
+
+        with prog_scope_guard(main_prog=main_prog, startup_prog=startup_prog):
+            data = fluid.layers.data(
+                name="words", shape=[1], dtype="int64", lod_level=1)
+            label = fluid.layers.data(name="label", shape=[1], dtype="int64")
+            avg_cost = bow_net(data, label, self.word_dict_len)
+            AdamW = fluid.contrib.extend_with_decoupled_weight_decay(
+                fluid.optimizer.Adam)
+
+            optimizer = AdamW(
+                learning_rate=self.learning_rate, weight_decay=0.0)
+            optimizer.minimize(avg_cost)
+
+        self.assertEqual(len(weight_decay_ops(main_prog)), 0)
+
+    def test_weight_decay_apply_optimize(self):
+        main_prog = fluid.framework.Program()
+        startup_prog = fluid.framework.Program()
+
+        with prog_scope_guard(main_prog=main_prog, startup_prog=startup_prog):
+            data = fluid.layers.data(
+                name="words", shape=[1], dtype="int64", lod_level=1)
+            label = fluid.layers.data(name="label", shape=[1], dtype="int64")
+            avg_cost = bow_net(data, label, self.word_dict_len)
+            AdamW = fluid.contrib.extend_with_decoupled_weight_decay(
+                fluid.optimizer.Adam)
+
+            optimizer = AdamW(
+                learning_rate=self.learning_rate,
+                weight_decay=self.learning_rate)
+            params_grads = optimizer.backward(loss=avg_cost)
+            optimizer.apply_optimize(
+                loss=avg_cost,
+                startup_program=startup_prog,
+                params_grads=params_grads)
+
+        self.assertEqual(
+            len(weight_decay_ops(main_prog)), len(params_grads))
+
+    def test_minimize_twice(self):
+        AdamW = fluid.contrib.extend_with_decoupled_weight_decay(
+            fluid.optimizer.Adam)
+        optimizer = AdamW(
+            learning_rate=self.learning_rate,
+            weight_decay=self.learning_rate)
+        # the parameters of both programs have the same names
+        for _ in range(2):
+            main_prog = fluid.framework.Program()
+            startup_prog = fluid.framework.Program()
+            with prog_scope_guard(
+                    main_prog=main_prog, startup_prog=startup_prog):
+                data = fluid.layers.data(
+                    name="words", shape=[1], dtype="int64", lod_level=1)
+                label = fluid.layers.data(
+                    name="label", shape=[1], dtype="int64")
+                avg_cost = bow_net(data, label, self.word_dict_len)
+                optimizer.minimize(avg_cost)
+
+            self.assertEqual(
+                len(weight_decay_ops(main_prog)),
+                len(main_prog.global_block().all_parameters()))
+
+    def test_weight_decay_tensor_coeff(self):
+        for place in get_places():
+            model = partial(bow_net, is_sparse=False)
+            param_sum1 = self.check_weight_decay(place, model)
+            param_sum2 = self.check_weight_decay(
+                place, model, tensor_coeff=True)
+
+            for i in range(len(param_sum1)):
+                self.assertTrue(
+                    np.allclose(param_sum1[i], param_sum2[i]),
+                    "Current place: {}, i: {}, sum1: {}, sum2: {}".format(
+                        place, i, param_sum1[i], param_sum2[i]))
+
+    def test_weight_decay_mixed_dtype(self):
+        main_prog = fluid.framework.Program()
+        startup_prog = fluid.framework.Program()
+
+        with prog_scope_guard(main_prog=main_prog, startup_prog=startup_prog):
+            block = main_prog.global_block()
+            params_grads = []
+            for dtype in ['float32', 'float16']:
+                param = block.create_parameter(
+                    name='param_' + dtype, shape=[4, 4], dtype=dtype)
+                grad = block.create_var(
+                    name=param.name + '@GRAD', shape=[4, 4], dtype=dtype)
+                params_grads.append((param, grad))
+            AdamW = fluid.contrib.extend_with_decoupled_weight_decay(
+                fluid.optimizer.Adam)
+            optimizer = AdamW(
+                learning_rate=self.learning_rate,
+                weight_decay=self.learning_rate)
+            optimizer._scale_parameters(params_grads)
+
+        maker = fluid.core.op_proto_and_checker_maker
+        op_role_var = maker.kOpRoleVarAttrName()
+        decay_ops = weight_decay_ops(main_prog)
+        self.assertEqual(len(decay_ops), len(params_grads))
+        for op, (param, grad) in zip(decay_ops, params_grads):
+            self.assertEqual(op.input('X'), [param.name])
+            self.assertEqual(op.attr(op_role_var), [param.name, grad.name])
+
     def test_weight_decay(self):
         for place in get_places():
             model = partial(bow_net, is_sparse=False)
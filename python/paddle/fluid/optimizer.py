@@ -2681,7 +2681,8 @@ class AdamaxOptimizer(Optimizer):
             outputs={
                 "ParamOut": param_and_grad[0],
                 "MomentOut": moment,
-                "InfNormOut": inf_norm
+                "InfNormOut": inf_norm,
+                "Beta1PowOut": beta1_pow_acc
             },
             attrs={
                 "beta1": self._beta1,
@@ -2692,24 +2693,6 @@ class AdamaxOptimizer(Optimizer):
 
         return adamax_op
 
-    def _finish_update(self, block, parameters_and_grads):
-        """Update Beta1 Power accumulator
-        """
-        assert isinstance(block, framework.Block)
-        for param, grad in parameters_and_grads:
-            if grad is None or param.trainable is False:
-                continue
-            with param.block.program._optimized_guard(
-                [param, grad]), name_scope('adamx'):
-                beta1_pow_acc = self._get_accumulator(self._beta1_pow_acc_str,
-                                                      param)
-                block.append_op(
-                    type="scale",
-                    inputs={"X": beta1_pow_acc},
-                    outputs={"Out": beta1_pow_acc},
-                    attrs={"scale": self._beta1},
-                    stop_gradient=True)
-
 
 class DpsgdOptimizer(Optimizer):
     r"""
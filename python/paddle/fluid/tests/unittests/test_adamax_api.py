@@ -36,6 +36,23 @@ class TestAdamaxAPI(unittest.TestCase):
         adam.step()
         adam.clear_gradients()
 
+    def test_adamax_param_lr_cache(self):
+        paddle.disable_static()
+        value = np.arange(26).reshape(2, 13).astype("float32")
+        a = paddle.to_tensor(value)
+        linear = paddle.nn.Linear(
+            13, 5, weight_attr=paddle.ParamAttr(learning_rate=2.0))
+        adam = paddle.optimizer.Adamax(
+            learning_rate=0.01, parameters=linear.parameters())
+        for lr in [0.01, 0.01, 0.02]:
+            adam.set_lr(lr)
+            out = linear(a)
+            out.backward()
+            adam.step()
+            adam.clear_gradients()
+            param_lr = adam._param_lr_cache[linear.weight.name]
+            self.assertTrue(np.allclose(param_lr.numpy(), lr * 2.0))
+
     def test_adamax_api(self):
         paddle.enable_static()
         place = fluid.CPUPlace()
@@ -64,6 +81,129 @@ class TestAdamaxAPI(unittest.TestCase):
         assert rets[0] is not None
 
 
+def run_adamax_dygraph(**kwargs):
+    # trains a Linear layer with Adamax(**kwargs), returns its parameters
+    paddle.disable_static()
+    paddle.seed(10)
+    value = np.arange(26).reshape(2, 13).astype("float32")
+    a = paddle.to_tensor(value)
+    linear = paddle.nn.Linear(13, 5)
+    adam = paddle.optimizer.Adamax(
+        learning_rate=0.01, parameters=linear.parameters(), **kwargs)
+    for _ in range(3):
+        out = linear(a)
+        out.backward()
+        adam.step()
+        adam.clear_gradients()
+    return [p.numpy() for p in linear.parameters()]
+
+
+class TestAdamaxMultiTensor(unittest.TestCase):
+    def test_adamax_multi_tensor_dygraph(self):
+        expected = run_adamax_dygraph(use_multi_tensor=False)
+        result = run_adamax_dygraph(use_multi_tensor=True)
+        for e, r in zip(expected, result):
+            self.assertTrue(np.allclose(e, r))
+
+    def test_adamax_multi_tensor_static(self):
+        paddle.enable_static()
+        place = fluid.CPUPlace()
+        shape = [2, 3, 8, 8]
+        exe = fluid.Executor(place)
+        train_prog = fluid.Program()
+        startup = fluid.Program()
+        with fluid.program_guard(train_prog, startup):
+            with fluid.unique_name.guard():
+                data = fluid.data(name="data", shape=shape)
+                conv = fluid.layers.conv2d(data, 8, 3)
+                loss = paddle.mean(conv)
+                opt = paddle.optimizer.Adamax(
+                    learning_rate=1e-5, use_multi_tensor=True)
+                opt.minimize(loss)
+
+        op_types = [op.type for op in train_prog.global_block().ops]
+        self.assertEqual(op_types.count("multi_tensor_adamax"), 1)
+        self.assertNotIn("adamax", op_types)
+        exe.run(startup)
+        data_np = np.random.random(shape).astype('float32')
+        rets = exe.run(train_prog, feed={"data": data_np}, fetch_list=[loss])
+        assert rets[0] is not None
+
+    def test_adamax_multi_tensor_device(self):
+        paddle.enable_static()
+        train_prog = fluid.Program()
+        startup = fluid.Program()
+        with fluid.program_guard(train_prog, startup):
+            with fluid.unique_name.guard():
+                data = fluid.data(name="data", shape=[2, 13])
+                with fluid.device_guard("gpu:0"):
+                    out = fluid.layers.fc(data, size=5)
+                with fluid.device_guard("gpu:1"):
+                    out = fluid.layers.fc(out, size=3)
+                    loss = paddle.mean(out)
+                opt = paddle.optimizer.Adamax(
+                    learning_rate=1e-5, use_multi_tensor=True)
+                opt.minimize(loss)
+
+        # the parameters of each device are updated by their own op
+        maker = fluid.core.op_proto_and_checker_maker
+        device_attr_name = maker.kOpDeviceAttrName()
+        ops = [
+            op for op in train_prog.global_block().ops
+            if op.type == "multi_tensor_adamax"
+        ]
+        self.assertEqual([op.attr(device_attr_name) for op in ops],
+                         ["gpu:0", "gpu:1"])
+        for op in ops:
+            self.assertEqual(len(op.input("Param")), 2)
+        paddle.disable_static()
+
+
+class TestAdamaxGlobalBetaPow(unittest.TestCase):
+    def test_adamax_global_beta_pow_dygraph(self):
+        expected = run_adamax_dygraph(use_global_beta_pow=False)
+        for use_multi_tensor in [False, True]:
+            result = run_adamax_dygraph(
+                use_global_beta_pow=True, use_multi_tensor=use_multi_tensor)
+            for e, r in zip(expected, result):
+                self.assertTrue(np.allclose(e, r))
+
+    def test_adamax_global_beta_pow_static(self):
+        paddle.enable_static()
+        place = fluid.CPUPlace()
+        shape = [2, 3, 8, 8]
+        exe = fluid.Executor(place)
+        train_prog = fluid.Program()
+        startup = fluid.Program()
+        with fluid.program_guard(train_prog, startup):
+            with fluid.unique_name.guard():
+                data = fluid.data(name="data", shape=shape)
+                conv = fluid.layers.conv2d(data, 8, 3)
+                loss = paddle.mean(conv)
+                opt = paddle.optimizer.Adamax(
+                    learning_rate=1e-5, use_global_beta_pow=True)
+                opt.minimize(loss)
+
+        op_types = [op.type for op in train_prog.global_block().ops]
+        self.assertEqual(op_types.count("adamax"), 2)
+        self.assertEqual(op_types.count("scale"), 1)
+        exe.run(startup)
+        data_np = np.random.random(shape).astype('float32')
+        rets = exe.run(train_prog, feed={"data": data_np}, fetch_list=[loss])
+        assert rets[0] is not None
+
+    def test_adamax_global_beta_pow_param_groups(self):
+        paddle.disable_static()
+        linear = paddle.nn.Linear(13, 5)
+        with self.assertRaises(ValueError):
+            paddle.optimizer.Adamax(
+                learning_rate=0.01,
+                parameters=[{
+                    'params': linear.parameters()
+                }],
+                use_global_beta_pow=True)
+
+
 class TestAdamaxAPIGroup(TestAdamaxAPI):
     def test_adamax_api_dygraph(self):
         paddle.disable_static()
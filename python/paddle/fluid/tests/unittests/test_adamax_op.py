@@ -45,7 +45,12 @@ class TestAdamaxOp1(OpTest):
             'Beta1Pow': np.array([beta1_pow]).astype("float32")
         }
 
-        self.attrs = {'beta1': beta1, 'beta2': beta2, 'epsilon': epsilon}
+        self.attrs = {
+            'beta1': beta1,
+            'one_minus_beta1': 1 - beta1,
+            'beta2': beta2,
+            'epsilon': epsilon
+        }
 
         param_out, moment_out, inf_norm_out = adamax_step(self.inputs,
                                                           self.attrs)
@@ -53,7 +58,8 @@ class TestAdamaxOp1(OpTest):
         self.outputs = {
             'ParamOut': param_out,
             'MomentOut': moment_out,
-            'InfNormOut': inf_norm_out
+            'InfNormOut': inf_norm_out,
+            'Beta1PowOut': self.inputs['Beta1Pow'] * beta1
         }
 
     def test_check_output(self):
@@ -93,7 +99,8 @@ class TestAdamaxOp2(OpTest):
         self.outputs = {
             'ParamOut': param_out,
             'MomentOut': moment_out,
-            'InfNormOut': inf_norm_out
+            'InfNormOut': inf_norm_out,
+            'Beta1PowOut': self.inputs['Beta1Pow'] * beta1
         }
 
     def test_check_output(self):
@@ -138,7 +145,8 @@ class TestAdamaxOpMultipleSteps(OpTest):
             self.outputs = {
                 'ParamOut': param_out,
                 'MomentOut': moment_out,
-                'InfNormOut': inf_norm_out
+                'InfNormOut': inf_norm_out,
+                'Beta1PowOut': self.inputs['Beta1Pow'] * self.attrs['beta1']
             }
 
             # Verify output for this step
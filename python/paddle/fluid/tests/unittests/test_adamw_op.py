@@ -74,6 +74,45 @@ class TestAdamWOp(unittest.TestCase):
                     epsilon=1e-8)
                 opt.minimize(loss)
 
+        # the parameters are decayed in place
+        op_types = [op.type for op in train_prog.global_block().ops]
+        self.assertNotIn("assign", op_types)
+        exe.run(startup)
+        data_np = np.random.random(shape).astype('float32')
+        rets = exe.run(train_prog, feed={"data": data_np}, fetch_list=[loss])
+        assert rets[0] is not None
+        paddle.disable_static()
+
+    def test_adamw_op_lr_scheduler(self):
+        paddle.enable_static()
+        place = fluid.CPUPlace()
+        shape = [2, 3, 8, 8]
+        exe = fluid.Executor(place)
+        train_prog = fluid.Program()
+        startup = fluid.Program()
+        with fluid.program_guard(train_prog, startup):
+            with fluid.unique_name.guard():
+                data = fluid.data(name="data", shape=shape)
+                conv = fluid.layers.conv2d(data, 8, 3)
+                loss = paddle.mean(conv)
+                lr = paddle.optimizer.lr.StepDecay(
+                    learning_rate=0.1, step_size=1)
+                opt = paddle.optimizer.AdamW(
+                    learning_rate=lr, weight_decay=0.01)
+                opt.minimize(loss)
+
+        # the decay coeff is a Tensor, it is multiplied on the device
+        ops = train_prog.global_block().ops
+        op_types = [op.type for op in ops]
+        self.assertNotIn("assign", op_types)
+        params = [p.name for p in train_prog.global_block().all_parameters()]
+        decay_ops = [
+            op for op in ops
+            if op.type == "elementwise_mul" and op.input("X")[0] in params
+        ]
+        self.assertEqual(len(decay_ops), len(params))
+        for op in decay_ops:
+            self.assertEqual(op.input("X"), op.output("Out"))
         exe.run(startup)
         data_np = np.random.random(shape).astype('float32')
         rets = exe.run(train_prog, feed={"data": data_np}, fetch_list=[loss])
@@ -0,0 +1,78 @@
+#   Copyright (c) 2021 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import print_function
+
+import unittest
+import numpy as np
+from op_test import OpTest
+from test_adamax_op import adamax_step
+
+
+class TestMultiTensorAdamaxOp(OpTest):
+    def setUp(self):
+        '''Test MultiTensorAdamax Operator with parameters of different shapes
+        '''
+        self.op_type = "multi_tensor_adamax"
+        beta1 = 0.78
+        beta2 = 0.899
+        epsilon = 1e-5
+        self.attrs = {'beta1': beta1, 'beta2': beta2, 'epsilon': epsilon}
+
+        inputs = {
+            'Param': [],
+            'Grad': [],
+            'Moment': [],
+            'InfNorm': [],
+            'LearningRate': [],
+            'Beta1Pow': []
+        }
+        outputs = {
+            'ParamOut': [],
+            'MomentOut': [],
+            'InfNormOut': [],
+            'Beta1PowOut': []
+        }
+        for i, shape in enumerate([(102, 105), (3, 7), (13, )]):
+            single_inputs = {
+                'Param': np.random.uniform(-1, 1, shape).astype("float32"),
+                'Grad': np.random.uniform(-1, 1, shape).astype("float32"),
+                'Moment': np.random.uniform(-1, 1, shape).astype("float32"),
+                # The infinity norm is positive
+                'InfNorm': np.random.random(shape).astype("float32"),
+                'LearningRate':
+                np.array([0.002 * (i + 1)]).astype("float32"),
+                'Beta1Pow': np.array([beta1**(i + 1)]).astype("float32")
+            }
+            param_out, moment_out, inf_norm_out = adamax_step(single_inputs,
+                                                              self.attrs)
+            for name, value in single_inputs.items():
+                inputs[name].append((name.lower() + str(i), value))
+            outputs['ParamOut'].append(('param_out' + str(i), param_out))
+            outputs['MomentOut'].append(('moment_out' + str(i), moment_out))
+            outputs['InfNormOut'].append(
+                ('inf_norm_out' + str(i), inf_norm_out))
+            outputs['Beta1PowOut'].append(
+                ('beta1_pow_out' + str(i),
+                 single_inputs['Beta1Pow'] * beta1))
+
+        self.inputs = inputs
+        self.outputs = outputs
+
+    def test_check_output(self):
+        self.check_output()
+
+
+if __name__ == "__main__":
+    unittest.main()
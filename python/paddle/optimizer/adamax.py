@@ -15,7 +15,8 @@
 from .optimizer import Optimizer
 from ..fluid import core
 from ..fluid import framework
-from ..fluid.framework import Variable, name_scope
+from ..fluid.framework import Variable, name_scope, device_guard
+from .lr import LRScheduler
 
 __all__ = []
 
@@ -75,6 +76,17 @@ class Adamax(Optimizer):
         name (str, optional): Normally there is no need for user to set this property.
             For more information, please refer to :ref:`api_guide_Name`.
             The default value is None.
+        use_multi_tensor (bool, optional): Whether to update the parameters on
+            one device with one ``multi_tensor_adamax`` operator instead of one
+            ``adamax`` operator per parameter. The operator lists all its
+            (param, grad) pairs in its ``op_role_var``, so it can not be used
+            with passes expecting one pair per optimize operator, such as the
+            ``ReduceStrategy.Reduce`` of ``BuildStrategy``. The default value
+            is False.
+        use_global_beta_pow (bool, optional): Whether to use one Beta1 Power
+            accumulator for all the parameters instead of one per parameter,
+            it is updated by one ``scale`` operator after all the parameters.
+            It can not be used with parameter groups. The default value is False.
 
     **Notes**:
         **Currently, Adamax doesn't support sparse parameter optimization.**
@@ -139,7 +151,9 @@ class Adamax(Optimizer):
                  parameters=None,
                  weight_decay=None,
                  grad_clip=None,
-                 name=None):
+                 name=None,
+                 use_multi_tensor=False,
+                 use_global_beta_pow=False):
         assert learning_rate is not None
         assert beta1 is not None
         assert beta2 is not None
@@ -158,8 +172,23 @@ class Adamax(Optimizer):
             name=name)
         self.type = "adamax"
         self._beta1 = beta1
+        # computed once here instead of in every adamax kernel
+        self._one_minus_beta1 = 1.0 - beta1
         self._beta2 = beta2
         self._epsilon = epsilon
+        self._use_multi_tensor = use_multi_tensor
+        self._use_global_beta_pow = use_global_beta_pow
+        if use_global_beta_pow and self._param_groups and isinstance(
+                self._param_groups[0], dict):
+            raise ValueError(
+                "use_global_beta_pow can not be used with parameter groups.")
+        # (param, grad, learning_rate) collected by _append_optimize_op,
+        # they are updated together in _finish_update
+        self._multi_tensor_params_grads_lrs = []
+        # learning rate tensors of parameters in dygraph mode, they are
+        # valid until the learning rate of the optimizer changes
+        self._param_lr_cache = {}
+        self._param_lr_cache_lr = None
         self._default_dict = {
             'beta1': beta1,
             'beta2': beta2,
@@ -167,6 +196,9 @@ class Adamax(Optimizer):
         }
 
     def _create_accumulators(self, block, parameters):
+        # checked once per optimization pass, _append_optimize_op and
+        # _finish_update get the same block
+        assert isinstance(block, framework.Block)
         if isinstance(parameters, dict):
             parameters = self._update_param_group(parameters)
 
@@ -174,40 +206,79 @@ class Adamax(Optimizer):
         for p in parameters:
             self._add_accumulator(self._moment_acc_str, p)
             self._add_accumulator(self._inf_norm_acc_str, p)
-            self._add_accumulator(
+            if not self._use_global_beta_pow:
+                self._add_accumulator(
+                    name=self._beta1_pow_acc_str,
+                    param=p,
+                    fill_value=self._beta1,
+                    shape=[1])
+        if self._use_global_beta_pow:
+            self._add_global_accumulator(
                 name=self._beta1_pow_acc_str,
-                param=p,
                 fill_value=self._beta1,
                 shape=[1])
 
+    def _get_param_lr(self, param_and_grad):
+        if not framework.in_dygraph_mode():
+            return self._create_param_lr(param_and_grad)
+
+        if isinstance(self._learning_rate, LRScheduler):
+            lr = self._learning_rate()
+        else:
+            lr = self._learning_rate
+        if lr != self._param_lr_cache_lr:
+            self._param_lr_cache = {}
+            self._param_lr_cache_lr = lr
+
+        param_name = param_and_grad[0].name
+        param_lr = self._param_lr_cache.get(param_name)
+        if param_lr is None:
+            param_lr = self._create_param_lr(param_and_grad)
+            self._param_lr_cache[param_name] = param_lr
+        return param_lr
+
+    def _get_beta1_pow_acc(self, param):
+        if self._use_global_beta_pow:
+            return self._get_global_accumulator(self._beta1_pow_acc_str)
+        return self._get_accumulator(self._beta1_pow_acc_str, param)
+
     def _append_optimize_op(self, block, param_and_grad):
-        assert isinstance(block, framework.Block)
         if isinstance(param_and_grad, dict):
             param_and_grad = self._update_param_group(param_and_grad)
 
+        if self._use_multi_tensor:
+            self._multi_tensor_params_grads_lrs.append(
+                (param_and_grad[0], param_and_grad[1],
+                 self._get_param_lr(param_and_grad)))
+            return None
+
         moment = self._get_accumulator(self._moment_acc_str, param_and_grad[0])
         inf_norm = self._get_accumulator(self._inf_norm_acc_str,
                                          param_and_grad[0])
-        beta1_pow_acc = self._get_accumulator(self._beta1_pow_acc_str,
-                                              param_and_grad[0])
+        beta1_pow_acc = self._get_beta1_pow_acc(param_and_grad[0])
+        outputs = {
+            "ParamOut": param_and_grad[0],
+            "MomentOut": moment,
+            "InfNormOut": inf_norm
+        }
+        # the global Beta1 Power accumulator is updated once in _finish_update
+        if not self._use_global_beta_pow:
+            outputs["Beta1PowOut"] = beta1_pow_acc
         # create the adamax optimize op
         adamax_op = block.append_op(
             type=self.type,
             inputs={
                 "Param": param_and_grad[0],
                 "Grad": param_and_grad[1],
-                "LearningRate": self._create_param_lr(param_and_grad),
+                "LearningRate": self._get_param_lr(param_and_grad),
                 "Moment": moment,
                 "InfNorm": inf_norm,
                 "Beta1Pow": beta1_pow_acc
             },
-            outputs={
-                "ParamOut": param_and_grad[0],
-                "MomentOut": moment,
-                "InfNormOut": inf_norm
-            },
+            outputs=outputs,
             attrs={
                 "beta1": self._beta1,
+                "one_minus_beta1": self._one_minus_beta1,
                 "beta2": self._beta2,
                 "epsilon": self._epsilon
             },
@@ -215,43 +286,98 @@ class Adamax(Optimizer):
 
         return adamax_op
 
+    def _append_optimize_multi_tensor_op(self, block):
+        """Update all the collected parameters and their Beta1 Power
+        accumulators with one multi_tensor_adamax op per device
+        """
+        params_grads_lrs = self._multi_tensor_params_grads_lrs
+        self._multi_tensor_params_grads_lrs = []
+
+        # one op per device, so that it is placed on the device of its
+        # parameters like the adamax op of each parameter
+        devices = []
+        device_params_grads_lrs = {}
+        for param, grad, lr in params_grads_lrs:
+            device = self._get_device_for_param(param.name)
+            if device not in device_params_grads_lrs:
+                devices.append(device)
+                device_params_grads_lrs[device] = []
+            device_params_grads_lrs[device].append((param, grad, lr))
+
+        multi_tensor_adamax_ops = []
+        for device in devices:
+            with device_guard(device):
+                multi_tensor_adamax_ops.append(
+                    self._append_multi_tensor_adamax_op(
+                        block, device_params_grads_lrs[device]))
+        return multi_tensor_adamax_ops
+
+    def _append_multi_tensor_adamax_op(self, block, params_grads_lrs):
+        params = [p for p, _, _ in params_grads_lrs]
+        grads = [g for _, g, _ in params_grads_lrs]
+        lrs = [lr for _, _, lr in params_grads_lrs]
+        moments = [
+            self._get_accumulator(self._moment_acc_str, p) for p in params
+        ]
+        inf_norms = [
+            self._get_accumulator(self._inf_norm_acc_str, p) for p in params
+        ]
+        beta1_pow_accs = [self._get_beta1_pow_acc(p) for p in params]
+        outputs = {
+            "ParamOut": params,
+            "MomentOut": moments,
+            "InfNormOut": inf_norms
+        }
+        if not self._use_global_beta_pow:
+            outputs["Beta1PowOut"] = beta1_pow_accs
+        op_role_vars = []
+        for param, grad in zip(params, grads):
+            op_role_vars.extend([param, grad])
+
+        with block.program._optimized_guard(op_role_vars), name_scope(
+                'adamax'):
+            multi_tensor_adamax_op = block.append_op(
+                type="multi_tensor_adamax",
+                inputs={
+                    "Param": params,
+                    "Grad": grads,
+                    "LearningRate": lrs,
+                    "Moment": moments,
+                    "InfNorm": inf_norms,
+                    "Beta1Pow": beta1_pow_accs
+                },
+                outputs=outputs,
+                attrs={
+                    "beta1": self._beta1,
+                    "one_minus_beta1": self._one_minus_beta1,
+                    "beta2": self._beta2,
+                    "epsilon": self._epsilon
+                },
+                stop_gradient=True)
+
+        return multi_tensor_adamax_op
+
     def _finish_update(self, block, parameters_and_grads):
-        """Update Beta1 Power accumulator
+        """Append the multi_tensor_adamax op if it is used and update the
+        global Beta1 Power accumulator, the accumulators of each parameter
+        are updated by the adamax ops themselves
         """
-        assert isinstance(block, framework.Block)
-        if isinstance(parameters_and_grads, list):
-            for param, grad in parameters_and_grads:
-                if grad is None or param.stop_gradient is True:
-                    continue
-                with param.block.program._optimized_guard(
-                    [param, grad]), name_scope('adamax'):
-                    beta1_pow_acc = self._get_accumulator(
-                        self._beta1_pow_acc_str, param)
-                    block.append_op(
-                        type="scale",
-                        inputs={"X": beta1_pow_acc},
-                        outputs={"Out": beta1_pow_acc},
-                        attrs={"scale": self._beta1},
-                        stop_gradient=True)
-        else:
-            for param, grad in parameters_and_grads['params']:
-                if grad is None or param.stop_gradient is True:
-                    continue
-                with param.block.program._optimized_guard(
-                    [param, grad]), name_scope('adamax'):
-                    beta1_pow_acc = self._get_accumulator(
-                        self._beta1_pow_acc_str, param)
-                    self._beta1 = parameters_and_grads.get(
-                        'beta1', self._default_dict['beta1'])
-                    block.append_op(
-                        type="scale",
-                        inputs={"X": beta1_pow_acc},
-                        outputs={"Out": beta1_pow_acc},
-                        attrs={"scale": self._beta1},
-                        stop_gradient=True)
+        if self._use_multi_tensor:
+            self._append_optimize_multi_tensor_op(block)
+        if self._use_global_beta_pow:
+            beta1_pow_acc = self._get_global_accumulator(
+                self._beta1_pow_acc_str)
+            with block.program._optimized_guard([]), name_scope('adamax'):
+                block.append_op(
+                    type="scale",
+                    inputs={"X": beta1_pow_acc},
+                    outputs={"Out": beta1_pow_acc},
+                    attrs={"scale": self._beta1},
+                    stop_gradient=True)
 
     def _update_param_group(self, parameters):
         self._beta1 = parameters.get('beta1', self._default_dict['beta1'])
+        self._one_minus_beta1 = 1.0 - self._beta1
         self._beta2 = parameters.get('beta2', self._default_dict['beta2'])
         self._epsilon = parameters.get('epsilon', self._default_dict['epsilon'])
         parameters = parameters.get('params')
@@ -217,13 +217,35 @@ class AdamW(Adam):
             find_master = (self._multi_precision and
                            param.dtype == core.VarDesc.VarType.FP16)
             if find_master:
-                master_weight = self._master_weights[param.name]
-                scaled_param = master_weight * decay_coeff
-                paddle.fluid.layers.assign(
-                    input=scaled_param, output=master_weight)
+                decay_param = self._master_weights[param.name]
             else:
-                scaled_param = param * decay_coeff
-                paddle.fluid.layers.assign(input=scaled_param, output=param)
+                decay_param = param
+
+            # decay in place, no temporary tensor and assign op are needed
+            if isinstance(decay_coeff, framework.Variable):
+                # multiply on the device instead of passing decay_coeff as
+                # the ScaleTensor of scale op, which copies it to the host
+                if decay_coeff.dtype != decay_param.dtype:
+                    key = (learning_rate, decay_param.dtype)
+                    cast_coeff = self._lr_to_coeff.get(key, None)
+                    if cast_coeff is None:
+                        cast_coeff = paddle.cast(decay_coeff, decay_param.dtype)
+                        self._lr_to_coeff[key] = cast_coeff
+                    decay_coeff = cast_coeff
+                block.append_op(
+                    type="elementwise_mul",
+                    inputs={"X": decay_param,
+                            "Y": decay_coeff},
+                    outputs={"Out": decay_param},
+                    attrs={"axis": -1},
+                    stop_gradient=True)
+            else:
+                block.append_op(
+                    type="scale",
+                    inputs={"X": decay_param},
+                    outputs={"Out": decay_param},
+                    attrs={"scale": decay_coeff},
+                    stop_gradient=True)
 
     def _append_optimize_op(self, block, param_and_grad):
         self._append_decoupled_weight_decay(block, param_and_grad)